@@ -19,6 +19,7 @@ from kohakuengine.config import (
     Use,
     capture_globals,
     load_config_file,
+    load_config_for_workers,
     load_from_dict,
     use,
     use_config,
@@ -55,6 +56,7 @@ __all__ = [
     "introspect",
     "coerce_globals",
     "load_config_file",
+    "load_config_for_workers",
     "load_from_dict",
     "EntrypointNotFound",
     "MultipleEntrypoints",
@@ -4,6 +4,7 @@ import argparse
 import difflib
 import io
 import itertools
+import shlex
 import sys
 from pathlib import Path
 from typing import Any, Iterator
@@ -101,6 +102,11 @@ def create_parser() -> argparse.ArgumentParser:
         default="subprocess",
         help="Execution mode",
     )
+    par_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the command for each task without running anything.",
+    )
     par_parser.set_defaults(func=cmd_workflow_parallel)
 
     config_parser = subparsers.add_parser("config", help="Config utilities")
@@ -165,11 +171,8 @@ def _sweep_to_generator(
             merged = {**base_globals, **overrides}
             if defaults:
                 merged = coerce_globals(merged, defaults)
-            yield Config(
-                globals_dict=merged,
-                args=list(base_args),
-                kwargs=dict(base_kwargs),
-                metadata={**base_meta, **overrides},
+            yield Config._unchecked(
+                merged, base_args.copy(), base_kwargs.copy(), {**base_meta, **overrides}
             )
 
     return ConfigGenerator(gen())
@@ -249,12 +252,20 @@ def cmd_workflow_sequential(args: argparse.Namespace) -> None:
 
 
 def cmd_workflow_parallel(args: argparse.Namespace) -> None:
+    if args.dry_run and args.mode != "subprocess":
+        raise SystemExit("--dry-run is only supported with --mode subprocess")
     config = load_config_file(args.config) if args.config else None
     scripts = [Script(p, config=config) for p in args.scripts]
     use_subprocess = args.mode == "subprocess"
     workflow = Parallel(
         scripts, max_workers=args.workers, use_subprocess=use_subprocess
     )
+    if args.dry_run:
+        plan = workflow.dry_run()
+        print(f"Dry run: {len(plan)} task(s)")
+        for worker_id, cmd in plan:
+            print(f"  [worker {worker_id}] {shlex.join(cmd)}")
+        sys.exit(0)
     results = workflow.run()
     print(f"Parallel workflow completed ({len(results)} executions)")
     sys.exit(0)
@@ -309,9 +320,12 @@ def _print_config(config: Config) -> None:
 def cmd_config_check(args: argparse.Namespace) -> None:
     config = load_config_file(args.config)
     if isinstance(config, ConfigGenerator):
-        configs = list(config)
+        # Stream the sweep: only the key union and the first config are kept.
+        first: Config | None = None
         provided_keys: set[str] = set()
-        for cfg in configs:
+        for cfg in config:
+            if first is None:
+                first = cfg
             provided_keys.update(cfg.globals_dict.keys())
     else:
         provided_keys = set(config.globals_dict.keys())
@@ -331,7 +345,7 @@ def cmd_config_check(args: argparse.Namespace) -> None:
         new_value = (
             config.globals_dict[k]
             if isinstance(config, Config)
-            else next(iter(configs)).globals_dict.get(k, "<sweep>")
+            else first.globals_dict.get(k, "<sweep>")
         )
         print(f"  [OK]  {k}: {defaults[k]!r} -> {new_value!r}")
     typos = 0
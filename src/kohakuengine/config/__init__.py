@@ -11,6 +11,7 @@ from kohakuengine.config.generator import ConfigGenerator
 from kohakuengine.config.loader import (
     ConfigLoader,
     load_config_file,
+    load_config_for_workers,
     load_from_dict,
     use_config,
 )
@@ -33,6 +34,7 @@ __all__ = [
     "ConfigGenerator",
     "ConfigLoader",
     "load_config_file",
+    "load_config_for_workers",
     "load_from_dict",
     "capture_globals",
     "CaptureGlobals",
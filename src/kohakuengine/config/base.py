@@ -1,8 +1,8 @@
 """Base configuration classes for KohakuEngine."""
 
-import inspect
+import sys
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from types import FrameType, ModuleType
 from typing import Any
 
@@ -59,18 +59,18 @@ class CaptureGlobals:
         self._frame_globals: dict[str, Any] = {}
 
     def __enter__(self) -> "CaptureGlobals":
-        caller = inspect.currentframe().f_back
+        caller = sys._getframe(1)
         self._frame_globals = caller.f_globals
         self._before = set(caller.f_globals.keys())
         return self
 
     def __exit__(self, *args: Any) -> bool:
-        after = set(self._frame_globals.keys())
-        for name in after - self._before:
-            value = self._frame_globals[name]
-            if value is self:
-                continue
-            self.captured[name] = value
+        before = self._before
+        self.captured.update(
+            (name, value)
+            for name, value in self._frame_globals.items()
+            if name not in before and value is not self
+        )
         return False
 
 
@@ -115,7 +115,7 @@ def _filter_globals(
         if isinstance(value, Use):
             out[name] = value.value
             continue
-        if isinstance(value, type) or callable(value):
+        if callable(value):  # functions, classes, callable instances
             if getattr(value, "__module__", None) == module_name:
                 out[name] = value
             continue
@@ -131,7 +131,7 @@ def _frame_module_name(frame: FrameType) -> str:
     return "<unknown>"
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """
     Configuration for one script execution.
@@ -143,6 +143,9 @@ class Config:
     - ``kwargs`` -- keyword arguments forwarded to the entrypoint
     - ``metadata`` -- arbitrary tracking/logging info (not injected)
 
+    Slotted: sweeps build one instance per point, so there is no
+    per-instance ``__dict__``. Fields stay assignable.
+
     Examples:
         >>> Config(globals_dict={"lr": 0.01}, kwargs={"device": "cuda"})
         Config(globals_dict={'lr': 0.01}, args=[], kwargs={'device': 'cuda'}, metadata={})
@@ -171,10 +174,37 @@ class Config:
         if isinstance(self.args, tuple):
             self.args = list(self.args)
 
+    @classmethod
+    def _unchecked(
+        cls,
+        globals_dict: dict[str, Any],
+        args: list[Any],
+        kwargs: dict[str, Any],
+        metadata: dict[str, Any],
+    ) -> "Config":
+        """
+        Build a Config from fields the caller already built, skipping checks.
+
+        Internal fast path for factories that construct the field values
+        themselves (a fresh dict, a list copy, ...). User-supplied values
+        must go through the normal constructor. Subclasses always do, so
+        their own fields and ``__post_init__`` are not skipped.
+        """
+        if cls is not Config:
+            return cls(
+                globals_dict=globals_dict, args=args, kwargs=kwargs, metadata=metadata
+            )
+        config = object.__new__(cls)
+        config.globals_dict = globals_dict
+        config.args = args
+        config.kwargs = kwargs
+        config.metadata = metadata
+        return config
+
     @classmethod
     def from_context(cls, context: CaptureGlobals) -> "Config":
         """Create a Config from the captured globals of a ``with`` block."""
-        return cls(globals_dict=dict(context.captured))
+        return cls._unchecked(context.captured.copy(), [], {}, {})
 
     @classmethod
     def from_globals(cls) -> "Config":
@@ -184,6 +214,46 @@ class Config:
         Locally-defined callables and classes are captured automatically.
         Imported callables/classes are skipped unless wrapped in ``use()``.
         """
-        frame = inspect.currentframe().f_back
+        frame = sys._getframe(1)
         module_name = _frame_module_name(frame)
-        return cls(globals_dict=_filter_globals(frame.f_globals, module_name))
+        return cls._unchecked(_filter_globals(frame.f_globals, module_name), [], {}, {})
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the Config as a plain dict, the inverse of ``Config.from_dict``.
+
+        The containers are shallow copies. Not cached: fields are mutable,
+        so a memoized view could go stale.
+        """
+        return {
+            "globals": dict(self.globals_dict),
+            "args": list(self.args),
+            "kwargs": dict(self.kwargs),
+            "metadata": dict(self.metadata),
+        }
+
+    def with_overrides(self, **overrides: Any) -> "Config":
+        """
+        Return a copy of this Config with ``overrides`` merged into globals.
+
+        ``args``, ``kwargs`` and ``metadata`` are shallow-copied, so the new
+        Config can be mutated without affecting this one. Subclasses are
+        rebuilt with ``dataclasses.replace``, which keeps their own fields
+        and runs their ``__post_init__``.
+
+        Examples:
+            >>> base = Config(globals_dict={"lr": 0.01, "epochs": 10})
+            >>> base.with_overrides(lr=0.1).globals_dict
+            {'lr': 0.1, 'epochs': 10}
+        """
+        globals_dict = {**self.globals_dict, **overrides}
+        args, kwargs, metadata = list(self.args), dict(self.kwargs), dict(self.metadata)
+        if type(self) is not Config:
+            return replace(
+                self,
+                globals_dict=globals_dict,
+                args=args,
+                kwargs=kwargs,
+                metadata=metadata,
+            )
+        return Config._unchecked(globals_dict, args, kwargs, metadata)
@@ -53,15 +53,16 @@ class ConfigGenerator:
 
         try:
             config = next(self._generator)
-            if not isinstance(config, Config):
-                raise TypeError(
-                    f"Generator must yield Config objects, got {type(config).__name__}"
-                )
-            return config
         except StopIteration:
             self._exhausted = True
             raise
 
+        if not isinstance(config, Config):
+            raise TypeError(
+                f"Generator must yield Config objects, got {type(config).__name__}"
+            )
+        return config
+
     @property
     def exhausted(self) -> bool:
         """Check if generator is exhausted."""
@@ -3,11 +3,12 @@
 import importlib.util
 import inspect
 import itertools
+import os
 import sys
 import warnings
 from pathlib import Path
-from types import ModuleType
-from typing import Any, Iterator
+from types import CodeType, ModuleType
+from typing import Any, Iterable, Iterator
 
 from kohakuengine.config.base import Config, _filter_globals
 from kohakuengine.config.generator import ConfigGenerator
@@ -22,9 +23,36 @@ _USED_CONFIGS_ATTR = "_kogine_used_configs"
 # Absolute paths currently being resolved by ``use_config`` (cycle guard).
 _USE_CONFIG_STACK: list[str] = []
 
+# Compiled config code keyed by (absolute path, mtime_ns, size). Editing a
+# file changes its key; the oldest entry is evicted once the cache is full.
+_CODE_CACHE: dict[tuple[str, int, int], CodeType] = {}
+_CODE_CACHE_SIZE = 128
+
+
+def _compile_config(config_path: Path) -> CodeType:
+    """Compile a config file, reusing the code object while it is unchanged."""
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    filename = os.path.abspath(config_path)
+    key = (filename, st.st_mtime_ns, st.st_size)
+    code = _CODE_CACHE.get(key)
+    if code is None:
+        # The code object is shared by every spelling of the path, so it must
+        # carry the same absolute filename the cache key uses.
+        code = compile(config_path.read_bytes(), filename, "exec")
+        if len(_CODE_CACHE) >= _CODE_CACHE_SIZE:
+            del _CODE_CACHE[next(iter(_CODE_CACHE))]
+        _CODE_CACHE[key] = code
+    return code
+
 
 def _exec_config_module(config_path: Path) -> ModuleType:
     """Load a config file as an importable module."""
+    # Compile first: a missing file must raise FileNotFoundError, and
+    # spec_from_file_location returns None for paths without a .py suffix.
+    code = _compile_config(config_path)
     module_name = f"_kogine_config_{config_path.stem}_{abs(hash(str(config_path)))}"
     spec = importlib.util.spec_from_file_location(module_name, config_path)
     if spec is None or spec.loader is None:
@@ -32,7 +60,7 @@ def _exec_config_module(config_path: Path) -> ModuleType:
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
     try:
-        spec.loader.exec_module(module)
+        exec(code, vars(module))
     except Exception:
         sys.modules.pop(module_name, None)
         raise
@@ -86,8 +114,7 @@ def use_config(path: str | Path) -> Config:
         base = use_config("base.py")
         return Config(globals_dict={**base.globals_dict, "lr": 0.5})
     """
-    frame = inspect.currentframe()
-    caller_globals = frame.f_back.f_globals if frame and frame.f_back else {}
+    caller_globals = sys._getframe(1).f_globals
     base_path = _resolve_sibling_path(path, caller_globals)
 
     key = str(base_path)
@@ -214,11 +241,8 @@ def _expand_sweep(module: ModuleType) -> ConfigGenerator:
 
     def generator() -> Iterator[Config]:
         if not sweep:
-            yield Config(
-                globals_dict=dict(base),
-                args=list(args),
-                kwargs=dict(kwargs),
-                metadata=dict(base_metadata),
+            yield Config._unchecked(
+                base.copy(), args.copy(), kwargs.copy(), base_metadata.copy()
             )
             return
 
@@ -233,11 +257,8 @@ def _expand_sweep(module: ModuleType) -> ConfigGenerator:
             overrides = dict(zip(axes, combo))
             new_globals = {**base, **overrides}
             new_metadata = {**base_metadata, **overrides}
-            yield Config(
-                globals_dict=new_globals,
-                args=list(args),
-                kwargs=dict(kwargs),
-                metadata=new_metadata,
+            yield Config._unchecked(
+                new_globals, args.copy(), kwargs.copy(), new_metadata
             )
 
     return ConfigGenerator(generator())
@@ -250,12 +271,7 @@ def _synthesize_from_module(module: ModuleType) -> Config:
     globals_dict, args, kwargs, metadata = _apply_used_configs(
         module, globals_dict, args, kwargs, metadata
     )
-    return Config(
-        globals_dict=globals_dict,
-        args=args,
-        kwargs=kwargs,
-        metadata=metadata,
-    )
+    return Config._unchecked(globals_dict, args, kwargs, metadata)
 
 
 def _invoke_config_gen(
@@ -303,29 +319,63 @@ def load_config_file(
         ``Config`` or ``ConfigGenerator``.
     """
     config_path = Path(config_path)
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
+    # A missing file surfaces from the stat in _compile_config.
     module = _exec_config_module(config_path)
+    _warn_ignored_sweep(module, config_path)
+    return _resolve_module(module, config_path, worker_id)
+
 
-    has_config_gen = hasattr(module, "config_gen")
-    has_CONFIG = hasattr(module, "CONFIG")
-    has_sweep = hasattr(module, "_sweep")
+def load_config_for_workers(
+    config_path: str | Path,
+    worker_ids: Iterable[int],
+) -> list[Config | ConfigGenerator]:
+    """
+    Load one config file for several workers, executing it only once.
+
+    Equivalent to ``[load_config_file(config_path, worker_id=w) for w in
+    worker_ids]``, but the file body runs a single time and only the
+    resolution step (``config_gen(worker_id=w)``, sweep expansion, ...) is
+    repeated per worker.
+
+    Args:
+        config_path: Path to a ``.py`` config file.
+        worker_ids: Worker ids, one result per id, in order.
 
-    if has_config_gen:
-        if has_sweep:
+    Returns:
+        List of ``Config`` or ``ConfigGenerator``, aligned with ``worker_ids``.
+    """
+    config_path = Path(config_path)
+    module = _exec_config_module(config_path)
+    _warn_ignored_sweep(module, config_path)
+    configs = []
+    for worker_id in worker_ids:
+        configs.append(_resolve_module(module, config_path, worker_id))
+    return configs
+
+
+def _warn_ignored_sweep(module: ModuleType, config_path: Path) -> None:
+    """Warn the caller of a ``load_*`` function that ``_sweep`` is shadowed."""
+    if not hasattr(module, "_sweep"):
+        return
+    for name in ("config_gen", "CONFIG"):
+        if hasattr(module, name):
             warnings.warn(
-                f"{config_path}: _sweep is ignored because config_gen is defined.",
-                stacklevel=2,
+                f"{config_path}: _sweep is ignored because {name} is defined.",
+                stacklevel=3,
             )
+            return
+
+
+def _resolve_module(
+    module: ModuleType,
+    config_path: Path,
+    worker_id: int | None,
+) -> Config | ConfigGenerator:
+    """Apply the ``load_config_file`` resolution order to an executed module."""
+    if hasattr(module, "config_gen"):
         return _invoke_config_gen(module, worker_id)
 
-    if has_CONFIG:
-        if has_sweep:
-            warnings.warn(
-                f"{config_path}: _sweep is ignored because CONFIG is defined.",
-                stacklevel=2,
-            )
+    if hasattr(module, "CONFIG"):
         config = module.CONFIG
         if not isinstance(config, Config):
             raise ValueError(
@@ -333,14 +383,18 @@ def load_config_file(
             )
         return config
 
-    if has_sweep:
+    if hasattr(module, "_sweep"):
         return _expand_sweep(module)
 
     return _synthesize_from_module(module)
 
 
 def load_from_dict(data: dict) -> Config:
-    """Create a Config from a dict (e.g. a parsed YAML/TOML/JSON payload)."""
+    """
+    Create a Config from a dict (e.g. a parsed YAML/TOML/JSON payload).
+
+    The payload is user data, so it goes through the validating constructor.
+    """
     return Config(
         globals_dict=data.get("globals", {}),
         args=data.get("args", []),
@@ -359,6 +413,13 @@ class ConfigLoader:
     ) -> Config | ConfigGenerator:
         return load_config_file(config_path, worker_id=worker_id)
 
+    @staticmethod
+    def load_config_for_workers(
+        config_path: str | Path,
+        worker_ids: Iterable[int],
+    ) -> list[Config | ConfigGenerator]:
+        return load_config_for_workers(config_path, worker_ids)
+
     @staticmethod
     def load_from_dict(data: dict) -> Config:
         return load_from_dict(data)
@@ -56,6 +56,11 @@ def _find_decorated(module: ModuleType) -> list[Callable]:
     return found
 
 
+def _may_have_main_guard(source: bytes) -> bool:
+    """Cheap pre-check: a main guard needs both names in the raw source."""
+    return b"__main__" in source and b"__name__" in source
+
+
 def _find_main_block_function(tree: ast.AST) -> str | None:
     """Find the function called inside ``if __name__ == "__main__":``."""
     for node in ast.walk(tree):
@@ -142,13 +147,12 @@ def find_entrypoint(
 
     searched.append('if __name__ == "__main__": block')
     if script_path is not None and Path(script_path).exists():
-        tree = ast.parse(
-            Path(script_path).read_text(encoding="utf-8"),
-            filename=str(script_path),
-        )
-        name = _find_main_block_function(tree)
-        if name and hasattr(module, name):
-            return getattr(module, name)
+        source = Path(script_path).read_bytes()
+        if _may_have_main_guard(source):
+            tree = ast.parse(source, filename=str(script_path))
+            name = _find_main_block_function(tree)
+            if name and hasattr(module, name):
+                return getattr(module, name)
 
     for candidate in _CONVENTIONAL_NAMES:
         searched.append(f"{candidate}()")
@@ -14,6 +14,17 @@ from kohakuengine.config.generator import ConfigGenerator
 
 _FILE_ENTRYPOINT_RE = re.compile(r"\.py:([a-zA-Z_][a-zA-Z0-9_]*)$")
 
+_CONFIG_TEMPLATE = (
+    "from kohakuengine.config import Config\n\n"
+    "def config_gen():\n"
+    "    return Config(\n"
+    "        globals_dict={globals_dict},\n"
+    "        args={args},\n"
+    "        kwargs={kwargs},\n"
+    "        metadata={metadata},\n"
+    "    )\n"
+)
+
 
 @dataclass
 class Script:
@@ -91,48 +102,43 @@ class Script:
             return f"Script(module={self.module_name}, config={config_type})"
         return f"Script(path={self.path}, config={config_type})"
 
-    def _run_subprocess(
-        self, config: Config | None = None
-    ) -> subprocess.CompletedProcess:
-        """Execute this script in a subprocess via the ``kogine`` CLI."""
+    def _run_subprocess(self, config: Config | None = None) -> subprocess.Popen:
+        """Execute this script in a subprocess via the ``kogine`` CLI and wait."""
         config = config if config is not None else self.config
         env = os.environ.copy()
         env.setdefault("KOGINE_WORKER_ID", "0")
 
         script_ref = self.module_name if self.is_module else str(self.path)
 
+        temp_config = None
         if config is not None and not isinstance(config, ConfigGenerator):
             temp_config = _serialize_config(config)
-            cmd = [
-                sys.executable,
-                "-m",
-                "kohakuengine.cli",
-                "run",
-                script_ref,
-                "--config",
-                str(temp_config),
-            ]
-        else:
-            cmd = [sys.executable, "-m", "kohakuengine.cli", "run", script_ref]
-
-        proc = subprocess.Popen(cmd, env=env)
-        proc.wait()
+        cmd = [sys.executable, "-m", "kohakuengine.cli", "run", script_ref]
+        if temp_config is not None:
+            cmd += ["--config", str(temp_config)]
+
+        try:
+            proc = subprocess.Popen(cmd, env=env)
+            proc.wait()
+        finally:
+            if temp_config is not None:
+                temp_config.unlink(missing_ok=True)
         return proc
 
 
+def _render_config_source(config: Config) -> str:
+    """Render a Config as the source of a ``config_gen`` config file."""
+    return _CONFIG_TEMPLATE.format(
+        globals_dict=repr(config.globals_dict),
+        args=repr(config.args),
+        kwargs=repr(config.kwargs),
+        metadata=repr(config.metadata),
+    )
+
+
 def _serialize_config(config: Config) -> Path:
     """Write a Config to a temp ``.py`` file usable by the CLI."""
     fd, path = tempfile.mkstemp(suffix=".py", prefix="kogine_config_")
-    body = (
-        "from kohakuengine.config import Config\n\n"
-        "def config_gen():\n"
-        f"    return Config(\n"
-        f"        globals_dict={config.globals_dict!r},\n"
-        f"        args={config.args!r},\n"
-        f"        kwargs={config.kwargs!r},\n"
-        f"        metadata={config.metadata!r},\n"
-        "    )\n"
-    )
     with os.fdopen(fd, "w", encoding="utf-8") as f:
-        f.write(body)
+        f.write(_render_config_source(config))
     return Path(path)
@@ -45,13 +45,19 @@ class ScriptWorkflow(Workflow):
         """
         Validate all scripts exist.
 
+        Each distinct path is checked once, however many scripts share it.
+
         Returns:
             True if valid
 
         Raises:
             ValueError: If any script is invalid
         """
+        seen = set()
         for script in self.scripts:
+            if script.path in seen:
+                continue
             if not script.path.exists():
                 raise ValueError(f"Script not found: {script.path}")
+            seen.add(script.path)
         return True
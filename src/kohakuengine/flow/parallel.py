@@ -1,17 +1,25 @@
 """Parallel workflow execution using subprocesses."""
 
+import multiprocessing
 import os
 import subprocess
 import sys
-import tempfile
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import nullcontext
+from multiprocessing.context import BaseContext
 from pathlib import Path
 from typing import Any
 
 from kohakuengine.config.base import Config
 from kohakuengine.config.generator import ConfigGenerator
 from kohakuengine.engine.executor import ScriptExecutor
-from kohakuengine.engine.script import Script
+from kohakuengine.engine.script import Script, _serialize_config
 from kohakuengine.flow.base import ScriptWorkflow
 
 
@@ -32,6 +40,25 @@ def _execute_script_helper(script: Script, config: Config | None) -> Any:
     return executor.execute(config)
 
 
+def _pool_context() -> BaseContext | None:
+    """
+    Pick the multiprocessing context for pool mode.
+
+    ``fork`` reuses the parent's already-imported interpreter state, so
+    workers start far faster than under ``spawn``/``forkserver``. Forking
+    while other threads are running is unsafe: a lock held by another
+    thread is copied into the child in its locked state and never
+    released. Only use ``fork`` on Linux when the parent is
+    single-threaded; otherwise keep the platform default.
+
+    Returns:
+        The ``fork`` context, or None for the platform default
+    """
+    if sys.platform == "linux" and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    return None
+
+
 class Parallel(ScriptWorkflow):
     """
     Execute scripts in parallel using subprocesses.
@@ -50,6 +77,7 @@ class Parallel(ScriptWorkflow):
         scripts: list[Script],
         max_workers: int | None = None,
         use_subprocess: bool = True,
+        executor: Executor | None = None,
     ):
         """
         Initialize parallel workflow.
@@ -58,10 +86,14 @@ class Parallel(ScriptWorkflow):
             scripts: List of scripts to execute
             max_workers: Maximum parallel workers (default: CPU count)
             use_subprocess: If True, use subprocess; if False, use ProcessPoolExecutor
+            executor: Existing pool to run pool-mode tasks on instead of a new
+                ProcessPoolExecutor per run. The caller owns it; it is not
+                shut down. Ignored in subprocess mode.
         """
         super().__init__(scripts)
         self.max_workers = max_workers
         self.use_subprocess = use_subprocess
+        self.executor = executor
 
     def run(self) -> list[Any]:
         """
@@ -75,34 +107,27 @@ class Parallel(ScriptWorkflow):
         else:
             return self._run_process_pool()
 
-    def _run_subprocess(self) -> list[subprocess.CompletedProcess]:
+    def _run_subprocess(self) -> list[subprocess.Popen]:
         """
         Execute using subprocess.Popen.
 
         Each script runs as: kogine run script.py --config temp_config.py
-        Config is passed via temporary file.
+        Config is passed via temporary file, removed once the task exits.
 
         Returns:
-            List of CompletedProcess objects
+            List of finished Popen objects
         """
-        # Collect all tasks to execute
-        tasks = []
-        worker_id = 0
-
-        for script in self.scripts:
-            if isinstance(script.config, ConfigGenerator):
-                # For generators, we need to iterate
-                for config in script.config:
-                    tasks.append((script, config, worker_id))
-                    worker_id += 1
-            else:
-                tasks.append((script, script.config, worker_id))
-                worker_id += 1
+        tasks = self._collect_tasks()
 
         def run_task(task):
             script, config, wid = task
-            proc = self._spawn_subprocess(script, config, wid)
-            proc.wait()
+            config_path = self._create_temp_config(config) if config else None
+            try:
+                proc = self._spawn_subprocess(script, config_path, wid)
+                proc.wait()
+            finally:
+                if config_path is not None:
+                    config_path.unlink(missing_ok=True)
             return proc
 
         # Use ThreadPoolExecutor to limit concurrent subprocesses
@@ -116,21 +141,68 @@ class Parallel(ScriptWorkflow):
 
         return results
 
+    def dry_run(self) -> list[tuple[int, list[str]]]:
+        """
+        Plan the subprocess tasks without launching them.
+
+        Temporary config files are still written so the returned commands
+        can be run by hand. Generator configs are consumed.
+
+        Returns:
+            List of ``(worker_id, argv)`` pairs, one per task
+
+        Raises:
+            ValueError: If the workflow runs in pool mode, where no
+                commands are launched
+        """
+        if not self.use_subprocess:
+            raise ValueError("dry_run() is only supported with use_subprocess=True")
+        return [
+            (
+                worker_id,
+                self._build_command(
+                    script, self._create_temp_config(config) if config else None
+                ),
+            )
+            for script, config, worker_id in self._collect_tasks()
+        ]
+
+    def _collect_tasks(self) -> list[tuple[Script, Config | None, int]]:
+        """
+        Expand scripts (and generator configs) into numbered tasks.
+
+        Returns:
+            List of ``(script, config, worker_id)`` tuples
+        """
+        tasks = []
+        worker_id = 0
+
+        for script in self.scripts:
+            if isinstance(script.config, ConfigGenerator):
+                # For generators, we need to iterate
+                for config in script.config:
+                    tasks.append((script, config, worker_id))
+                    worker_id += 1
+            else:
+                tasks.append((script, script.config, worker_id))
+                worker_id += 1
+
+        return tasks
+
     def _spawn_subprocess(
-        self, script: Script, config: Config | None, worker_id: int
+        self, script: Script, config_path: Path | None, worker_id: int
     ) -> subprocess.Popen:
         """
         Spawn subprocess for script execution.
 
         Strategy:
-        1. Create temporary config file
-        2. Launch: kogine run script.py --config temp_config.py
-        3. Set KOGINE_WORKER_ID environment variable
-        4. Return process handle
+        1. Launch: kogine run script.py --config temp_config.py
+        2. Set KOGINE_WORKER_ID environment variable
+        3. Return process handle
 
         Args:
             script: Script to execute
-            config: Configuration to apply
+            config_path: Temporary config file to pass, if any
             worker_id: Worker ID for this process
 
         Returns:
@@ -140,22 +212,23 @@ class Parallel(ScriptWorkflow):
         env = os.environ.copy()
         env["KOGINE_WORKER_ID"] = str(worker_id)
 
-        # Create temp config file
-        if config:
-            temp_config = self._create_temp_config(config)
-            cmd = [
-                sys.executable,
-                "-m",
-                "kohakuengine.cli",
-                "run",
-                str(script.path),
-                "--config",
-                str(temp_config),
-            ]
-        else:
-            cmd = [sys.executable, "-m", "kohakuengine.cli", "run", str(script.path)]
+        return subprocess.Popen(self._build_command(script, config_path), env=env)
+
+    def _build_command(self, script: Script, config_path: Path | None) -> list[str]:
+        """
+        Build the ``kogine run`` argv for one task.
+
+        Args:
+            script: Script to execute
+            config_path: Temporary config file to pass, if any
 
-        return subprocess.Popen(cmd, env=env)
+        Returns:
+            Command line as a list of arguments
+        """
+        cmd = [sys.executable, "-m", "kohakuengine.cli", "run", str(script.path)]
+        if config_path is not None:
+            cmd += ["--config", str(config_path)]
+        return cmd
 
     def _create_temp_config(self, config: Config) -> Path:
         """
@@ -167,24 +240,7 @@ class Parallel(ScriptWorkflow):
         Returns:
             Path to temporary config file
         """
-        # Create temp file
-        fd, path = tempfile.mkstemp(suffix=".py", prefix="kogine_config_")
-
-        # Write config
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(f"""
-from kohakuengine.config import Config
-
-def config_gen():
-    return Config(
-        globals_dict={config.globals_dict!r},
-        args={config.args!r},
-        kwargs={config.kwargs!r},
-        metadata={config.metadata!r}
-    )
-""")
-
-        return Path(path)
+        return _serialize_config(config)
 
     def _run_process_pool(self) -> list[Any]:
         """
@@ -198,7 +254,14 @@ def config_gen():
         """
         results = []
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+        if self.executor is not None:
+            pool = nullcontext(self.executor)
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=_pool_context()
+            )
+
+        with pool as executor:
             futures = []
 
             for script in self.scripts:
@@ -3,14 +3,13 @@
 import os
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from kohakuengine.config.base import Config
 from kohakuengine.config.generator import ConfigGenerator
 from kohakuengine.engine.executor import ScriptExecutor
-from kohakuengine.engine.script import Script
+from kohakuengine.engine.script import Script, _serialize_config
 from kohakuengine.flow.base import ScriptWorkflow
 
 
@@ -60,19 +59,25 @@ class Sequential(ScriptWorkflow):
         Returns:
             List of results from each script execution
         """
-        results = []
+        return list(self.iter_run())
 
+    def iter_run(self) -> Iterator[Any]:
+        """
+        Execute scripts in sequence, yielding each result as it finishes.
+
+        Same order as ``run()``, but generator configs are pulled one at a
+        time, so a long sweep never holds all its results at once.
+
+        Yields:
+            Result of each script execution
+        """
         for script in self.scripts:
             if isinstance(script.config, ConfigGenerator):
                 # Iterative execution
-                script_results = self._run_iterative(script)
-                results.extend(script_results)
+                yield from self._run_iterative(script)
             else:
                 # Single execution
-                result = self._run_once(script, script.config)
-                results.append(result)
-
-        return results
+                yield self._run_once(script, script.config)
 
     def _run_once(self, script: Script, config: Config | None) -> Any:
         """
@@ -92,7 +97,7 @@ class Sequential(ScriptWorkflow):
 
     def _run_subprocess(
         self, script: Script, config: Config | None
-    ) -> subprocess.CompletedProcess:
+    ) -> subprocess.Popen:
         """
         Execute script in subprocess.
 
@@ -101,27 +106,22 @@ class Sequential(ScriptWorkflow):
             config: Configuration to apply
 
         Returns:
-            CompletedProcess object
+            Finished Popen object
         """
         env = os.environ.copy()
         env["KOGINE_WORKER_ID"] = "0"
 
-        if config:
-            temp_config = self._create_temp_config(config)
-            cmd = [
-                sys.executable,
-                "-m",
-                "kohakuengine.cli",
-                "run",
-                str(script.path),
-                "--config",
-                str(temp_config),
-            ]
-        else:
-            cmd = [sys.executable, "-m", "kohakuengine.cli", "run", str(script.path)]
-
-        proc = subprocess.Popen(cmd, env=env)
-        proc.wait()
+        temp_config = self._create_temp_config(config) if config else None
+        cmd = [sys.executable, "-m", "kohakuengine.cli", "run", str(script.path)]
+        if temp_config is not None:
+            cmd += ["--config", str(temp_config)]
+
+        try:
+            proc = subprocess.Popen(cmd, env=env)
+            proc.wait()
+        finally:
+            if temp_config is not None:
+                temp_config.unlink(missing_ok=True)
         if proc.returncode != 0:
             raise RuntimeError(
                 f"Subprocess failed with exit code {proc.returncode}: {' '.join(cmd)}"
@@ -138,37 +138,24 @@ class Sequential(ScriptWorkflow):
         Returns:
             Path to temporary config file
         """
-        fd, path = tempfile.mkstemp(suffix=".py", prefix="kogine_config_")
+        return _serialize_config(config)
 
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(f"""
-from kohakuengine.config import Config
-
-def config_gen():
-    return Config(
-        globals_dict={config.globals_dict!r},
-        args={config.args!r},
-        kwargs={config.kwargs!r},
-        metadata={config.metadata!r}
-    )
-""")
-
-        return Path(path)
-
-    def _run_iterative(self, script: Script) -> list[Any]:
+    def _run_iterative(self, script: Script) -> Iterator[Any]:
         """
         Execute script iteratively with generator config.
 
+        The type check happens on call; each iteration runs only when the
+        returned iterator is advanced.
+
         Args:
             script: Script with ConfigGenerator
 
         Returns:
-            List of results from each iteration
+            Iterator over the result of each iteration
 
         Raises:
             TypeError: If script.config is not ConfigGenerator
         """
-        results = []
         config_gen = script.config
 
         if not isinstance(config_gen, ConfigGenerator):
@@ -176,11 +163,7 @@ def config_gen():
                 f"Expected ConfigGenerator, got {type(config_gen).__name__}"
             )
 
-        for config in config_gen:
-            result = self._run_once(script, config)
-            results.append(result)
-
-        return results
+        return (self._run_once(script, config) for config in config_gen)
 
 
 class Pipeline(Sequential):
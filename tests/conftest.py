@@ -1,7 +1,9 @@
 """Shared pytest fixtures."""
 
+import importlib.util
 import sys
 import textwrap
+import uuid
 
 import pytest
 
@@ -25,6 +27,26 @@ def restore_import_state():
             sys.modules.pop(name, None)
 
 
+@pytest.fixture
+def import_file(restore_import_state):
+    """Factory: import a file as a real module under a unique name.
+
+    Unlike an ``exec`` into a dict, this goes through the import system so
+    the code sees genuine module globals. The module is unregistered again
+    by ``restore_import_state`` when the test ends.
+    """
+
+    def _factory(path: "pathlib.Path") -> "types.ModuleType":
+        name = f"_test_mod_{path.stem}_{uuid.uuid4().hex}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module
+
+    return _factory
+
+
 @pytest.fixture
 def make_script(tmp_path):
     """Factory: write a script with given source, return its Path."""
@@ -49,23 +71,36 @@ def make_config(tmp_path):
     return _factory
 
 
+_SIMPLE_SCRIPT_SRC = """
+result = None
+lr = 0.1
+
+def main():
+    global result
+    result = lr
+    return result
+
+if __name__ == "__main__":
+    main()
+"""
+
+
 @pytest.fixture
 def simple_script(make_script):
-    return make_script(
-        "simple.py",
-        """
-        result = None
-        lr = 0.1
+    return make_script("simple.py", _SIMPLE_SCRIPT_SRC)
 
-        def main():
-            global result
-            result = lr
-            return result
 
-        if __name__ == "__main__":
-            main()
-        """,
-    )
+@pytest.fixture(scope="session")
+def shared_simple_script(tmp_path_factory):
+    """``simple_script`` written once per session.
+
+    For tests that never load the script in-process (child-process runs,
+    dry runs, workflow construction), so nothing can leak between them
+    through ``sys.modules``.
+    """
+    path = tmp_path_factory.mktemp("shared") / "simple.py"
+    path.write_text(_SIMPLE_SCRIPT_SRC, encoding="utf-8")
+    return path
 
 
 @pytest.fixture
@@ -6,9 +6,11 @@ import sys
 
 import pytest
 
+from kohakuengine import Config
 from kohakuengine.cli import (
     _parse_set,
     _parse_sweep,
+    _sweep_to_generator,
     cmd_config_check,
     cmd_config_show,
     cmd_config_validate,
@@ -73,11 +75,23 @@ def test_parse_sweep_missing_eq():
         _parse_sweep(["xyz"])
 
 
+def test_sweep_to_generator_accepts_reassigned_tuple_args():
+    base = Config()
+    base.args = (1, 2)
+    configs = list(_sweep_to_generator(base, {"lr": ["0.1", "0.2"]}, None))
+    assert [c.args for c in configs] == [[1, 2], [1, 2]]
+
+
 # ---------------------------------------------------------------------------
 # cmd_run
 # ---------------------------------------------------------------------------
 
 
+def _assert_all_in(haystack: str, *needles: str) -> None:
+    missing = [n for n in needles if n not in haystack]
+    assert not missing, f"missing {missing} in output:\n{haystack}"
+
+
 def _ns(**kw):
     defaults = dict(
         script=None,
@@ -87,6 +101,7 @@ def _ns(**kw):
         sweep=[],
         strict=False,
         subprocess=False,
+        dry_run=False,
     )
     defaults.update(kw)
     return argparse.Namespace(**defaults)
@@ -164,8 +179,7 @@ def test_cmd_config_show_static(bare_config, capsys):
         cmd_config_show(_ns(config=str(bare_config)))
     assert exc.value.code == 0
     out = capsys.readouterr().out
-    assert "globals_dict" in out
-    assert "lr" in out
+    _assert_all_in(out, "globals_dict", "lr", "0.5", "batch_size", "64", "Lowered")
 
 
 def test_cmd_config_show_sweep(make_config, capsys):
@@ -174,7 +188,7 @@ def test_cmd_config_show_sweep(make_config, capsys):
         cmd_config_show(_ns(config=str(cfg)))
     assert exc.value.code == 0
     out = capsys.readouterr().out
-    assert "Total configs: 2" in out
+    _assert_all_in(out, "Total configs: 2", "Config 1/2", "Config 2/2", "0.1", "0.2")
 
 
 def test_cmd_config_show_explicit_gen(make_config, capsys):
@@ -211,8 +225,7 @@ def test_cmd_config_check_hits(simple_script, bare_config, capsys):
         cmd_config_check(_ns(script=str(simple_script), config=str(bare_config)))
     assert exc.value.code == 0
     out = capsys.readouterr().out
-    assert "[OK]" in out
-    assert "lr" in out
+    _assert_all_in(out, "[OK]", "lr")
 
 
 def test_cmd_config_check_typo(make_script, make_config, capsys):
@@ -231,8 +244,7 @@ def test_cmd_config_check_typo(make_script, make_config, capsys):
         cmd_config_check(_ns(script=str(s), config=str(cfg)))
     assert exc.value.code == 1
     out = capsys.readouterr().out
-    assert "[??]" in out
-    assert "learning_rate" in out
+    _assert_all_in(out, "[??]", "learning_rate")
 
 
 def test_cmd_config_check_new_var(simple_script, make_config, capsys):
@@ -280,9 +292,9 @@ def test_cmd_workflow_sequential(simple_script, capsys):
     assert "Sequential" in out
 
 
-def test_cmd_workflow_parallel(simple_script, capsys):
+def test_cmd_workflow_parallel(shared_simple_script, capsys):
     args = _ns(
-        scripts=[str(simple_script)],
+        scripts=[str(shared_simple_script)],
         workers=1,
         mode="subprocess",
     )
@@ -291,14 +303,48 @@ def test_cmd_workflow_parallel(simple_script, capsys):
     assert exc.value.code == 0
 
 
+def test_parser_parallel_dry_run():
+    p = create_parser()
+    args = p.parse_args(["workflow", "parallel", "s.py", "--dry-run"])
+    assert args.dry_run is True
+
+
+def test_cmd_workflow_parallel_dry_run(shared_simple_script, monkeypatch, capsys):
+    def no_spawn(*a, **k):
+        raise AssertionError("dry run must not spawn subprocesses")
+
+    monkeypatch.setattr(subprocess, "Popen", no_spawn)
+    args = _ns(
+        scripts=[str(shared_simple_script), str(shared_simple_script)],
+        workers=1,
+        mode="subprocess",
+        dry_run=True,
+    )
+    with pytest.raises(SystemExit) as exc:
+        cmd_workflow_parallel(args)
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    assert "Dry run: 2 task(s)" in out
+    assert "[worker 1]" in out
+    assert str(shared_simple_script) in out
+
+
+def test_cmd_workflow_parallel_dry_run_rejects_pool_mode(shared_simple_script):
+    args = _ns(
+        scripts=[str(shared_simple_script)], workers=1, mode="pool", dry_run=True
+    )
+    with pytest.raises(SystemExit, match="--mode subprocess"):
+        cmd_workflow_parallel(args)
+
+
 # ---------------------------------------------------------------------------
 # Top-level main() -- thin smoke test via subprocess for argv handling
 # ---------------------------------------------------------------------------
 
 
-def test_cli_module_entry(simple_script):
+def test_cli_module_entry(shared_simple_script):
     """Spawn `python -m kohakuengine.cli run <script>` end-to-end."""
-    cmd = [sys.executable, "-m", "kohakuengine.cli", "run", str(simple_script)]
+    cmd = [sys.executable, "-m", "kohakuengine.cli", "run", str(shared_simple_script)]
     result = subprocess.run(cmd, capture_output=True, text=True)
     assert result.returncode == 0
     assert "executed successfully" in result.stdout
@@ -1,7 +1,10 @@
 """Tests for kohakuengine.config.base."""
 
 import math
+import pickle
+import re
 import warnings
+from dataclasses import dataclass, field
 
 import pytest
 
@@ -13,20 +16,114 @@ from kohakuengine.config.base import _filter_globals, _frame_module_name
 # ---------------------------------------------------------------------------
 
 
-def test_config_defaults():
+_DEFAULT_CFG = Config()
+_POPULATED_CFG = Config(
+    globals_dict={"a": 1}, args=[1, 2], kwargs={"b": 3}, metadata={"x": 1}
+)
+
+
+@dataclass
+class _TaggedConfig(Config):
+    """Config subclass with its own field and validation."""
+
+    tags: list = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if not isinstance(self.globals_dict.get("lr", 0.0), float):
+            raise TypeError("lr must be a float")
+
+
+@pytest.mark.parametrize(
+    "attr,value",
+    [("globals_dict", {}), ("args", []), ("kwargs", {}), ("metadata", {})],
+)
+def test_config_defaults(attr, value):
+    assert getattr(_DEFAULT_CFG, attr) == value
+
+
+@pytest.mark.parametrize(
+    "attr,value",
+    [
+        ("globals_dict", {"a": 1}),
+        ("args", [1, 2]),
+        ("kwargs", {"b": 3}),
+        ("metadata", {"x": 1}),
+    ],
+)
+def test_config_basic_fields(attr, value):
+    assert getattr(_POPULATED_CFG, attr) == value
+
+
+def test_config_defaults_not_shared():
+    assert Config().globals_dict is not Config().globals_dict
+
+
+def test_config_is_slotted():
     c = Config()
-    assert c.globals_dict == {}
-    assert c.args == []
-    assert c.kwargs == {}
-    assert c.metadata == {}
+    assert not hasattr(c, "__dict__")
+    c.globals_dict = {"reassigned": True}  # fields stay mutable
+    with pytest.raises(AttributeError):
+        c.not_a_field = 1
 
 
-def test_config_basic_fields():
-    c = Config(globals_dict={"a": 1}, args=[1, 2], kwargs={"b": 3}, metadata={"x": 1})
+def test_config_pickle_round_trip():
+    c = Config(globals_dict={"a": 1}, args=[2], kwargs={"b": 3}, metadata={"m": 4})
+    assert pickle.loads(pickle.dumps(c)) == c
+
+
+def test_config_unchecked_matches_constructor():
+    fields = ({"a": 1}, [2], {"b": 3}, {"m": 4})
+    fast = Config._unchecked(*fields)
+    assert fast == Config(*fields)
+    assert fast.globals_dict is fields[0]
+
+
+def test_config_with_overrides():
+    base = Config(
+        globals_dict={"lr": 0.01, "epochs": 10},
+        args=[1],
+        kwargs={"k": 2},
+        metadata={"m": 3},
+    )
+    new = base.with_overrides(lr=0.1, extra=True)
+    assert new.globals_dict == {"lr": 0.1, "epochs": 10, "extra": True}
+    assert base.globals_dict == {"lr": 0.01, "epochs": 10}
+    assert (new.args, new.kwargs, new.metadata) == ([1], {"k": 2}, {"m": 3})
+    assert new.args is not base.args
+    assert new.kwargs is not base.kwargs
+    assert new.metadata is not base.metadata
+
+
+def test_config_with_overrides_keeps_subclass():
+    base = _TaggedConfig(globals_dict={"lr": 0.01}, tags=["baseline"])
+    new = base.with_overrides(lr=0.1)
+    assert type(new) is _TaggedConfig
+    assert new.globals_dict == {"lr": 0.1}
+    assert new.tags == ["baseline"]
+    with pytest.raises(TypeError, match="lr must be a float"):
+        base.with_overrides(lr="bad")
+
+
+def test_config_to_dict_round_trip():
+    c = Config(globals_dict={"a": 1}, args=[2], kwargs={"b": 3}, metadata={"m": 4})
+    d = c.to_dict()
+    assert d == {
+        "globals": {"a": 1},
+        "args": [2],
+        "kwargs": {"b": 3},
+        "metadata": {"m": 4},
+    }
+    assert Config.from_dict(d) == c
+    d["globals"]["a"] = 99
     assert c.globals_dict == {"a": 1}
-    assert c.args == [1, 2]
-    assert c.kwargs == {"b": 3}
-    assert c.metadata == {"x": 1}
+
+
+def test_config_copies_accept_reassigned_tuple_args():
+    c = Config()
+    c.args = (1, 2)
+    assert c.to_dict()["args"] == [1, 2]
+    assert c.with_overrides(lr=0.1).args == [1, 2]
 
 
 def test_config_tuple_args_normalized():
@@ -35,13 +132,19 @@ def test_config_tuple_args_normalized():
     assert isinstance(c.args, list)
 
 
+_RE_GLOBALS = re.compile(r"globals_dict must be a dict")
+_RE_ARGS = re.compile(r"args must be a list or tuple")
+_RE_KWARGS = re.compile(r"kwargs must be a dict")
+_RE_METADATA = re.compile(r"metadata must be a dict")
+
+
 @pytest.mark.parametrize(
     "field,bad,expected",
     [
-        ("globals_dict", [], "globals_dict"),
-        ("args", {}, "args"),
-        ("kwargs", [], "kwargs"),
-        ("metadata", [], "metadata"),
+        ("globals_dict", [], _RE_GLOBALS),
+        ("args", {}, _RE_ARGS),
+        ("kwargs", [], _RE_KWARGS),
+        ("metadata", [], _RE_METADATA),
     ],
 )
 def test_config_rejects_wrong_types(field, bad, expected):
@@ -106,15 +209,18 @@ def test_capture_globals_excludes_self():
 # ---------------------------------------------------------------------------
 
 
-def test_filter_skips_private():
-    out = _filter_globals({"_x": 1, "x": 2}, "mod")
-    assert out == {"x": 2}
-
-
-def test_filter_skips_modules():
-    out = _filter_globals({"math": math, "y": 5}, "mod")
-    assert "math" not in out
-    assert out["y"] == 5
+@pytest.mark.parametrize(
+    "namespace,expected",
+    [
+        ({"_x": 1, "x": 2}, {"x": 2}),
+        ({"math": math, "y": 5}, {"y": 5}),
+        ({"sq": math.sqrt, "y": 5}, {"y": 5}),
+        ({"PathClass": type, "y": 5}, {"y": 5}),
+    ],
+    ids=["private", "modules", "imported_callables", "imported_classes"],
+)
+def test_filter_skips(namespace, expected):
+    assert _filter_globals(namespace, "mod") == expected
 
 
 def test_filter_unwraps_use():
@@ -132,11 +238,6 @@ def test_filter_includes_local_callables():
     assert out["local_fn"] is local_fn
 
 
-def test_filter_skips_imported_callables():
-    out = _filter_globals({"sq": math.sqrt}, "mod")
-    assert "sq" not in out
-
-
 def test_filter_includes_local_classes():
     class LocalCls:
         pass
@@ -146,11 +247,6 @@ def test_filter_includes_local_classes():
     assert out["LocalCls"] is LocalCls
 
 
-def test_filter_skips_imported_classes():
-    out = _filter_globals({"PathClass": type}, "mod")
-    assert "PathClass" not in out
-
-
 def test_filter_includes_plain_data():
     out = _filter_globals({"x": 1, "y": "s", "z": [1, 2]}, "mod")
     assert out == {"x": 1, "y": "s", "z": [1, 2]}
@@ -175,6 +271,32 @@ def test_from_globals_in_function_scope():
     assert "bs" not in cfg.globals_dict
 
 
+def test_from_globals_at_module_scope(make_config, import_file):
+    p = make_config(
+        "from_globals_mod.py",
+        """
+        import math
+        from kohakuengine.config import Config, use
+
+        lr = 0.01
+        _private = 1
+        sq = use(math.sqrt)
+
+        def helper():
+            return lr
+
+        cfg = Config.from_globals()
+        """,
+    )
+    mod = import_file(p)
+    captured = mod.cfg.globals_dict
+    assert captured["lr"] == 0.01
+    assert captured["helper"] is mod.helper
+    assert captured["sq"] is math.sqrt
+    for absent in ("math", "Config", "use", "_private", "cfg"):
+        assert absent not in captured
+
+
 def test_from_context():
     ns = _run_capture_at_module_scope(
         "with capture_globals() as ctx:\n    captured_x = 1\n"
@@ -183,6 +305,15 @@ def test_from_context():
     assert cfg.globals_dict["captured_x"] == 1
 
 
+def test_factories_run_subclass_init():
+    ns = _run_capture_at_module_scope("with capture_globals() as ctx:\n    x = 1\n")
+    for cfg in (_TaggedConfig.from_globals(), _TaggedConfig.from_context(ns["ctx"])):
+        assert type(cfg) is _TaggedConfig
+        assert cfg.tags == []
+    with pytest.raises(TypeError, match="lr must be a float"):
+        _TaggedConfig._unchecked({"lr": "bad"}, [], {}, {})
+
+
 def test_frame_module_name_unknown():
     class FakeFrame:
         f_globals = {}
@@ -34,6 +34,14 @@ def test_non_config_yield_raises():
         next(g)
 
 
+@pytest.mark.parametrize("bad_item", [None, {}, 42])
+def test_later_non_config_item_raises(bad_item):
+    g = ConfigGenerator(iter([Config(), bad_item]))
+    next(g)
+    with pytest.raises(TypeError, match="Config"):
+        next(g)
+
+
 def test_exhausted_after_stop_iteration():
     g = ConfigGenerator(iter([]))
     with pytest.raises(StopIteration):
@@ -42,6 +50,23 @@ def test_exhausted_after_stop_iteration():
         next(g)  # second call also raises
 
 
+def test_exhausted_does_not_reenter_iterator():
+    calls = 0
+
+    class Counting:
+        def __next__(self):
+            nonlocal calls
+            calls += 1
+            raise StopIteration
+
+    g = ConfigGenerator(Counting())
+    for _ in range(3):
+        with pytest.raises(StopIteration):
+            next(g)
+    assert g.exhausted is True
+    assert calls == 1
+
+
 def test_for_loop_iteration():
     g = ConfigGenerator(_gen())
     items = list(g)
@@ -1,9 +1,18 @@
 """Tests for kohakuengine.config.loader."""
 
+import os
+import sys
+from pathlib import Path
+
 import pytest
 
-from kohakuengine.config import Config, ConfigGenerator, ConfigLoader
-from kohakuengine.config.loader import load_config_file, load_from_dict
+from kohakuengine.config import Config, ConfigGenerator, ConfigLoader, loader
+from kohakuengine.config.loader import (
+    _compile_config,
+    load_config_file,
+    load_config_for_workers,
+    load_from_dict,
+)
 
 
 def test_load_explicit_config_gen(make_config):
@@ -49,6 +58,50 @@ def test_load_config_gen_with_worker_id(make_config):
     assert cfg.globals_dict == {"wid": 7}
 
 
+def test_load_config_for_workers_executes_once(make_config, monkeypatch):
+    p = make_config(
+        "c.py",
+        """
+        from kohakuengine.config import Config
+        def config_gen(worker_id=None):
+            return Config(globals_dict={"wid": worker_id})
+        """,
+    )
+    calls = []
+    real_exec = loader._exec_config_module
+    monkeypatch.setattr(
+        loader,
+        "_exec_config_module",
+        lambda path: calls.append(path) or real_exec(path),
+    )
+    cfgs = load_config_for_workers(p, [0, 1, 2])
+    assert [c.globals_dict["wid"] for c in cfgs] == [0, 1, 2]
+    assert len(calls) == 1
+
+
+def test_load_config_for_workers_fresh_sweep_per_worker(make_config):
+    p = make_config("c.py", "_sweep = {'lr': [0.1, 0.2]}")
+    g0, g1 = ConfigLoader.load_config_for_workers(p, [0, 1])
+    assert g0 is not g1
+    assert [c.globals_dict["lr"] for c in g0] == [0.1, 0.2]
+    assert [c.globals_dict["lr"] for c in g1] == [0.1, 0.2]
+
+
+def test_load_config_for_workers_warns_once_at_call_site(make_config):
+    p = make_config(
+        "c.py",
+        """
+        from kohakuengine.config import Config
+        CONFIG = Config(globals_dict={"x": 1})
+        _sweep = {"a": [1]}
+        """,
+    )
+    with pytest.warns(UserWarning, match="_sweep is ignored") as record:
+        load_config_for_workers(p, [0, 1, 2])
+    assert len(record) == 1
+    assert record[0].filename == __file__
+
+
 def test_load_config_gen_must_be_callable(make_config):
     p = make_config("c.py", "config_gen = 42")
     with pytest.raises(ValueError, match="callable"):
@@ -222,7 +275,8 @@ def test_load_sweep_warns_when_config_gen_present(make_config, recwarn):
         """,
     )
     load_config_file(p)
-    assert any("_sweep" in str(w.message) for w in recwarn.list)
+    [w] = [w for w in recwarn.list if "_sweep" in str(w.message)]
+    assert w.filename == __file__
 
 
 def test_load_sweep_warns_when_CONFIG_present(make_config, recwarn):
@@ -235,12 +289,16 @@ def test_load_sweep_warns_when_CONFIG_present(make_config, recwarn):
         """,
     )
     load_config_file(p)
-    assert any("_sweep" in str(w.message) for w in recwarn.list)
+    [w] = [w for w in recwarn.list if "_sweep" in str(w.message)]
+    assert w.filename == __file__
 
 
-def test_load_file_not_found():
-    with pytest.raises(FileNotFoundError):
-        load_config_file("/does/not/exist.py")
+@pytest.mark.parametrize("path", ["/does/not/exist.py", "/does/not/exist.txt"])
+def test_load_file_not_found(path):
+    before = set(sys.modules)
+    with pytest.raises(FileNotFoundError, match="Config file not found"):
+        load_config_file(path)
+    assert set(sys.modules) == before
 
 
 def test_load_from_dict():
@@ -280,3 +338,33 @@ def test_config_from_file_attached(make_config):
 def test_config_from_dict_attached():
     cfg = Config.from_dict({"globals": {"k": "v"}})
     assert cfg.globals_dict == {"k": "v"}
+
+
+def test_compiled_config_code_is_reused(make_config):
+    p = make_config("c.py", "x = 1")
+    assert _compile_config(p) is _compile_config(p)
+
+
+def test_compiled_config_code_uses_absolute_filename(make_config, monkeypatch):
+    p = make_config("c.py", "x = 1")
+    monkeypatch.chdir(p.parent)
+    relative = _compile_config(Path("c.py"))
+    assert relative is _compile_config(p)
+    assert relative.co_filename == os.path.abspath(p)
+
+
+def test_compiled_config_code_invalidated_on_edit(make_config):
+    p = make_config("c.py", "x = 1")
+    assert load_config_file(p).globals_dict == {"x": 1}
+    p.write_text("x = 222", encoding="utf-8")
+    assert load_config_file(p).globals_dict == {"x": 222}
+
+
+def test_compiled_config_cache_evicts_oldest(make_config, monkeypatch):
+    monkeypatch.setattr(loader, "_CODE_CACHE", {})
+    monkeypatch.setattr(loader, "_CODE_CACHE_SIZE", 1)
+    first = make_config("a.py", "x = 1")
+    second = make_config("b.py", "y = 2")
+    _compile_config(first)
+    _compile_config(second)
+    assert [key[0] for key in loader._CODE_CACHE] == [str(second)]
@@ -28,7 +28,7 @@ from kohakuengine.engine.entrypoint import (
 )
 from kohakuengine.engine.executor import ScriptExecutor
 from kohakuengine.engine.introspect import _import_no_main
-from kohakuengine.engine.script import _serialize_config
+from kohakuengine.engine.script import _render_config_source, _serialize_config
 from kohakuengine.flow.base import ScriptWorkflow, Workflow
 from kohakuengine.flow.flow import Flow
 from kohakuengine.flow.parallel import Parallel, _execute_script_helper
@@ -74,10 +74,10 @@ def test_describe_source_CONFIG(make_config):
     assert "CONFIG" in _describe_source(str(p))
 
 
-def test_cmd_run_subprocess(simple_script, capfd):
+def test_cmd_run_subprocess(shared_simple_script, capfd):
     """Run command in subprocess mode."""
     with pytest.raises(SystemExit) as exc:
-        cmd_run(_ns(script=str(simple_script), subprocess=True))
+        cmd_run(_ns(script=str(shared_simple_script), subprocess=True))
     assert exc.value.code == 0
     out = capfd.readouterr().out
     assert "subprocess" in out
@@ -144,8 +144,9 @@ def test_parallel_helper_function(simple_script):
     assert result == 0.3
 
 
-def test_sequential_subprocess_no_config(simple_script, tmp_path):
-    s = Script(str(simple_script))
+@pytest.mark.slow
+def test_sequential_subprocess_no_config(shared_simple_script):
+    s = Script(str(shared_simple_script))
     seq = Sequential([s], use_subprocess=True)
     results = seq.run()
     assert results[0].returncode == 0
@@ -205,34 +206,85 @@ def test_flow_custom_executor_other_class(simple_script):
 
 def test_script_serialize_round_trip():
     cfg = Config(globals_dict={"x": 1}, args=[1], kwargs={"y": 2}, metadata={"m": "v"})
+    namespace = {}
+    exec(_render_config_source(cfg), namespace)
+    assert namespace["config_gen"]() == cfg
+
+
+def test_serialize_config_writes_rendered_source():
+    cfg = Config(globals_dict={"x": 1})
     p = _serialize_config(cfg)
     try:
-        text = p.read_text()
-        assert "globals_dict={'x': 1}" in text
-        assert "args=[1]" in text
-        assert "kwargs={'y': 2}" in text
-        assert "metadata={'m': 'v'}" in text
+        assert p.read_text(encoding="utf-8") == _render_config_source(cfg)
+    finally:
+        os.unlink(p)
+
+
+@pytest.mark.parametrize("workflow_cls", [Sequential, Parallel])
+def test_workflow_temp_config_uses_shared_renderer(workflow_cls, shared_simple_script):
+    cfg = Config(globals_dict={"x": 1})
+    workflow = workflow_cls([Script(str(shared_simple_script))])
+    p = workflow._create_temp_config(cfg)
+    try:
+        assert p.read_text(encoding="utf-8") == _render_config_source(cfg)
     finally:
         os.unlink(p)
 
 
-def test_script_run_subprocess_via_method(simple_script):
+def _fake_popen(seen):
+    """Fake Popen that records the --config file it was given while running."""
+
+    class FakePopen:
+        def __init__(self, cmd, env=None):
+            self.args = cmd
+            self.returncode = None
+
+        def wait(self):
+            path = Path(self.args[self.args.index("--config") + 1])
+            seen.append((path, path.exists()))
+            self.returncode = 0
+            return 0
+
+    return FakePopen
+
+
+@pytest.mark.parametrize("runner", ["script", "sequential", "parallel"])
+def test_subprocess_temp_config_removed_after_run(
+    runner, shared_simple_script, monkeypatch
+):
+    seen = []
+    monkeypatch.setattr(subprocess, "Popen", _fake_popen(seen))
+    script = Script(str(shared_simple_script), config=Config(globals_dict={"x": 1}))
+    if runner == "script":
+        script._run_subprocess()
+    elif runner == "sequential":
+        Sequential([script], use_subprocess=True).run()
+    else:
+        Parallel([script], use_subprocess=True).run()
+    [(path, existed)] = seen
+    assert existed
+    assert not path.exists()
+
+
+@pytest.mark.slow
+def test_script_run_subprocess_via_method(shared_simple_script):
     cfg = Config(globals_dict={"lr": 0.55})
-    s = Script(str(simple_script), config=cfg)
+    s = Script(str(shared_simple_script), config=cfg)
     proc = s._run_subprocess()
     assert proc.returncode == 0
 
 
-def test_script_run_subprocess_no_config(simple_script):
-    s = Script(str(simple_script))
+def test_script_run_subprocess_no_config(shared_simple_script):
+    s = Script(str(shared_simple_script))
     proc = s._run_subprocess()
     assert proc.returncode == 0
 
 
-def test_script_run_subprocess_with_generator(simple_script):
+@pytest.mark.slow
+def test_script_run_subprocess_with_generator(shared_simple_script):
     """Generator skipped -- subprocess runs the script with no config."""
     gen = ConfigGenerator(iter([Config(globals_dict={"lr": 0.1})]))
-    s = Script(str(simple_script), config=gen)
+    s = Script(str(shared_simple_script), config=gen)
     proc = s._run_subprocess()
     assert proc.returncode == 0
 
@@ -286,24 +338,25 @@ def test_parse_cell_from_source_returns_correct_lines():
 # ---------------------------------------------------------------------------
 
 
-def test_is_main_guard_branches():
-    # Not a Compare
-    n = ast.parse("a + b", mode="eval").body
-    assert _is_main_guard(n) is False
-    # Wrong left
-    n = ast.parse("'x' == '__main__'", mode="eval").body
-    assert _is_main_guard(n) is False
-    # Wrong operator
-    n = ast.parse("__name__ != '__main__'", mode="eval").body
-    assert _is_main_guard(n) is False
-    # Multiple comparisons / wrong value
-    n = ast.parse("__name__ == 'main'", mode="eval").body
-    assert _is_main_guard(n) is False
-    n = ast.parse("a == b == c", mode="eval").body
-    assert _is_main_guard(n) is False
-    # Correct
-    n = ast.parse("__name__ == '__main__'", mode="eval").body
-    assert _is_main_guard(n) is True
+# Parsed once at import; each case is (expression node, expected result).
+_MAIN_GUARD_CASES = {
+    name: (ast.parse(src, mode="eval").body, expected)
+    for name, src, expected in [
+        ("not_compare", "a + b", False),
+        ("wrong_left", "'x' == '__main__'", False),
+        ("wrong_operator", "__name__ != '__main__'", False),
+        ("wrong_value", "__name__ == 'main'", False),
+        ("chained", "a == b == c", False),
+        ("main_guard", "__name__ == '__main__'", True),
+    ]
+}
+
+
+@pytest.mark.parametrize(
+    "node, expected", _MAIN_GUARD_CASES.values(), ids=_MAIN_GUARD_CASES.keys()
+)
+def test_is_main_guard_branches(node, expected):
+    assert _is_main_guard(node) is expected
 
 
 def test_find_entrypoint_decorator_dedup():
@@ -394,14 +447,29 @@ def test_executor_load_failure(monkeypatch, simple_script):
 # ---------------------------------------------------------------------------
 
 
-def test_script_run_attached_method_use_subprocess(simple_script):
+def test_script_run_attached_method_use_subprocess(shared_simple_script):
     """The attached Script.run(use_subprocess=True) branch."""
     cfg = Config(globals_dict={"lr": 0.42})
-    s = Script(str(simple_script), config=cfg)
+    s = Script(str(shared_simple_script), config=cfg)
     proc = s.run(use_subprocess=True)
     assert proc.returncode == 0
 
 
+def test_script_run_use_subprocess_returns_finished_popen(
+    shared_simple_script, monkeypatch
+):
+    seen = []
+    fake_popen = _fake_popen(seen)
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+    s = Script(str(shared_simple_script), config=Config(globals_dict={"lr": 0.42}))
+    proc = s.run(use_subprocess=True)
+    assert isinstance(proc, fake_popen)
+    assert proc.returncode == 0
+    [(config_path, existed)] = seen
+    assert existed
+    assert not config_path.exists()
+
+
 def test_main_guard_not_a_call_stmt(tmp_path):
     """An if __name__ block whose body contains non-Call statements."""
     p = tmp_path / "s.py"
@@ -415,6 +483,19 @@ def test_main_guard_not_a_call_stmt(tmp_path):
         find_entrypoint(mod, p)
 
 
+def test_main_guard_without_call_falls_back(tmp_path):
+    """A main guard that calls nothing defers to the conventional names."""
+    p = tmp_path / "s.py"
+    p.write_text("if __name__ == '__main__':\n    pass\n")
+    mod = types.ModuleType("m")
+
+    def main():
+        return "m"
+
+    mod.main = main
+    assert find_entrypoint(mod, p) is main
+
+
 def test_main_guard_outside_pattern(tmp_path):
     """A top-level `if` that is not a main guard at all."""
     p = tmp_path / "s.py"
@@ -456,18 +537,15 @@ def test_cell_resolved_skips_unknown_name():
     assert frozen == {}
 
 
-def test_executor_module_with_config_injection(tmp_path):
+def test_executor_module_with_config_injection(tmp_path, restore_import_state):
     """Module-based script + config: covers GlobalInjector path."""
     pkg = tmp_path / "pkg_inject"
     pkg.mkdir()
     (pkg / "__init__.py").write_text("")
     (pkg / "mod.py").write_text("value = 1\ndef main(): return value\n")
     sys.path.insert(0, str(tmp_path))
-    try:
-        s = Script("pkg_inject.mod", config=Config(globals_dict={"value": 99}))
-        assert ScriptExecutor(s).execute() == 99
-    finally:
-        sys.path.remove(str(tmp_path))
+    s = Script("pkg_inject.mod", config=Config(globals_dict={"value": 99}))
+    assert ScriptExecutor(s).execute() == 99
 
 
 def test_loader_spec_returns_none(monkeypatch, tmp_path):
@@ -487,6 +565,7 @@ def test_cli_subprocess_failure_exits_with_returncode(make_script, capfd):
     assert exc.value.code == 7
 
 
+@pytest.mark.slow
 def test_cli_module_main_block():
     """python -m kohakuengine.cli triggers the if __name__ == '__main__' block."""
     cmd = [sys.executable, "-m", "kohakuengine.cli", "--version"]
@@ -1,5 +1,6 @@
 """Tests for the entrypoint discovery cascade."""
 
+import ast
 import asyncio
 import types
 
@@ -9,6 +10,8 @@ from kohakuengine.engine.entrypoint import (
     EntrypointFinder,
     EntrypointNotFound,
     MultipleEntrypoints,
+    _find_main_block_function,
+    _may_have_main_guard,
     call_entrypoint,
     entrypoint,
     find_entrypoint,
@@ -119,6 +122,51 @@ def test_main_block_detection(tmp_path):
     assert found is go
 
 
+def test_main_block_nested_guard(tmp_path):
+    p = tmp_path / "s.py"
+    p.write_text(
+        "def go():\n    return 'g'\n\n"
+        "try:\n    if __name__ == '__main__':\n        go()\nfinally:\n    pass\n"
+    )
+    mod = types.ModuleType("m")
+
+    def go():
+        return "g"
+
+    mod.go = go
+    found = find_entrypoint(mod, p)
+    assert found is go
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        "if __name__ == '__main__':\n    go()\n",
+        'if (__name__) == "__main__":\n    go()\n',
+        "try:\n    if __name__ == '__main__':\n        go()\nfinally:\n    pass\n",
+        "if __name__ == '__main__':\n    pass\n",
+        "x = '__main__'\n",
+        "print(__name__)\n",
+        "if mode == '__main__':\n    go()\n",
+        "def go():\n    pass\n",
+    ],
+    ids=[
+        "guard",
+        "parens",
+        "nested",
+        "no_call",
+        "main_only",
+        "name_only",
+        "other_if",
+        "none",
+    ],
+)
+def test_main_guard_prefilter_agrees_with_ast(src):
+    found = _find_main_block_function(ast.parse(src)) is not None
+    # The pre-check may pass sources without a guard, never the reverse.
+    assert _may_have_main_guard(src.encode()) or not found
+
+
 def test_main_block_async_pattern(tmp_path):
     p = tmp_path / "s.py"
     p.write_text(
@@ -185,40 +233,40 @@ def test_main_block_function_must_exist_in_module(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_call_with_no_args():
-    def f():
-        return 1
-
-    assert call_entrypoint(f, [], {}) == 1
-
+def _no_args():
+    return 1
 
-def test_call_with_args_kwargs():
-    def f(x, y=10):
-        return x + y
 
-    assert call_entrypoint(f, [5], {"y": 3}) == 8
+def _x_plus_y(x, y=10):
+    return x + y
 
 
-def test_call_kwargs_filtered_to_match():
-    def f(x):
-        return x
+def _identity(x):
+    return x
 
-    # extra kwargs are dropped because f doesn't accept **kw
-    assert call_entrypoint(f, [], {"x": 1, "y": 2}) == 1
 
+def _var_kwargs(**kw):
+    return kw
 
-def test_call_var_kwargs():
-    def f(**kw):
-        return kw
 
-    assert call_entrypoint(f, [], {"a": 1, "b": 2}) == {"a": 1, "b": 2}
+def _var_args(*a):
+    return a
 
 
-def test_call_var_args():
-    def f(*a):
-        return a
-
-    assert call_entrypoint(f, [1, 2, 3], {}) == (1, 2, 3)
+@pytest.mark.parametrize(
+    "func, args, kwargs, expected",
+    [
+        (_no_args, [], {}, 1),
+        (_x_plus_y, [5], {"y": 3}, 8),
+        # extra kwargs are dropped because the function doesn't accept **kw
+        (_identity, [], {"x": 1, "y": 2}, 1),
+        (_var_kwargs, [], {"a": 1, "b": 2}, {"a": 1, "b": 2}),
+        (_var_args, [1, 2, 3], {}, (1, 2, 3)),
+    ],
+    ids=["no_args", "args_kwargs", "kwargs_filtered", "var_kwargs", "var_args"],
+)
+def test_call_sync(func, args, kwargs, expected):
+    assert call_entrypoint(func, args, kwargs) == expected
 
 
 def test_call_async_runs_in_loop():
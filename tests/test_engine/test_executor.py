@@ -61,31 +61,25 @@ def test_execute_explicit_entrypoint(make_script):
     assert ScriptExecutor(script).execute() == "h"
 
 
-def test_execute_module_path(tmp_path):
+def test_execute_module_path(tmp_path, restore_import_state):
     pkg = tmp_path / "pkg_exec"
     pkg.mkdir()
     (pkg / "__init__.py").write_text("")
     (pkg / "mod.py").write_text("def main(): return 'M'\n")
     sys.path.insert(0, str(tmp_path))
-    try:
-        s = Script("pkg_exec.mod")
-        assert ScriptExecutor(s).execute() == "M"
-    finally:
-        sys.path.remove(str(tmp_path))
+    s = Script("pkg_exec.mod")
+    assert ScriptExecutor(s).execute() == "M"
 
 
-def test_execute_module_import_failure(tmp_path, monkeypatch):
+def test_execute_module_import_failure(tmp_path, restore_import_state):
     sys.path.insert(0, str(tmp_path))
     pkg = tmp_path / "pkg_bad"
     pkg.mkdir()
     (pkg / "__init__.py").write_text("")
     (pkg / "broken.py").write_text("raise ImportError('nope')\n")
-    try:
-        s = Script("pkg_bad.broken")
-        with pytest.raises(RuntimeError, match="import module"):
-            ScriptExecutor(s).execute()
-    finally:
-        sys.path.remove(str(tmp_path))
+    s = Script("pkg_bad.broken")
+    with pytest.raises(RuntimeError, match="import module"):
+        ScriptExecutor(s).execute()
 
 
 def test_execute_module_property(simple_script):
@@ -10,9 +10,11 @@ from kohakuengine.engine.injector import PROTECTED_NAMES, GlobalInjector
 
 def test_inject_sets_attributes():
     mod = types.ModuleType("m")
-    GlobalInjector.inject(mod, {"a": 1, "b": "x"})
-    assert mod.a == 1
-    assert mod.b == "x"
+    values = {"a": 1, "b": "x", "items": [1, 2, 3], "opts": {"key": "value"}}
+    GlobalInjector.inject(mod, values)
+    # Injected by reference, not copied.
+    for name, value in values.items():
+        assert getattr(mod, name) is value
 
 
 @pytest.mark.parametrize("name", sorted(PROTECTED_NAMES))
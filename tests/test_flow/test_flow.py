@@ -13,9 +13,10 @@ def test_flow_sequential(make_script):
     assert flow.run() == ["a"]
 
 
-def test_flow_parallel(simple_script):
+@pytest.mark.slow
+def test_flow_parallel(shared_simple_script):
     scripts = [
-        Script(str(simple_script), config=Config(globals_dict={"lr": i / 10}))
+        Script(str(shared_simple_script), config=Config(globals_dict={"lr": i / 10}))
         for i in range(2)
     ]
     flow = Flow(scripts, mode="parallel", max_workers=2)
@@ -23,32 +24,45 @@ def test_flow_parallel(simple_script):
     assert len(results) == 2
 
 
+@pytest.mark.parametrize(
+    "mode, executor_cls, expected",
+    [("sequential", Sequential, False), ("parallel", Parallel, True)],
+)
+def test_flow_default_use_subprocess(
+    shared_simple_script, mode, executor_cls, expected
+):
+    flow = Flow([Script(str(shared_simple_script))], mode=mode)
+    assert flow.use_subprocess is expected
+    assert isinstance(flow._executor, executor_cls)
+    assert flow._executor.use_subprocess is expected
+
+
 def test_flow_invalid_mode():
     with pytest.raises(ValueError, match="Invalid mode"):
         Flow([], mode="bogus")
 
 
-def test_flow_validate_passes(simple_script):
-    flow = Flow([Script(str(simple_script))], mode="sequential")
+def test_flow_validate_passes(shared_simple_script):
+    flow = Flow([Script(str(shared_simple_script))], mode="sequential")
     assert flow.validate() is True
 
 
-def test_flow_repr(simple_script):
-    flow = Flow([Script(str(simple_script))], mode="sequential")
+def test_flow_repr(shared_simple_script):
+    flow = Flow([Script(str(shared_simple_script))], mode="sequential")
     assert "Flow(scripts=1" in repr(flow)
 
 
-def test_flow_custom_executor_class(simple_script):
+def test_flow_custom_executor_class(shared_simple_script):
     flow = Flow(
-        [Script(str(simple_script))],
+        [Script(str(shared_simple_script))],
         executor_class=Sequential,
     )
     assert isinstance(flow._executor, Sequential)
 
 
-def test_flow_custom_executor_parallel(simple_script):
+def test_flow_custom_executor_parallel(shared_simple_script):
     flow = Flow(
-        [Script(str(simple_script))],
+        [Script(str(shared_simple_script))],
         mode="parallel",
         executor_class=Parallel,
         max_workers=1,
@@ -1,29 +1,83 @@
 """Tests for Parallel workflow."""
 
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
 
 from kohakuengine import Config, ConfigGenerator, Parallel, Script
+from kohakuengine.flow.parallel import _pool_context
 
 
-def test_parallel_subprocess(simple_script):
-    scripts = [
-        Script(str(simple_script), config=Config(globals_dict={"lr": i / 10}))
-        for i in range(3)
+def _static_scripts(path):
+    return [
+        Script(str(path), config=Config(globals_dict={"lr": i / 10})) for i in range(3)
     ]
-    workflow = Parallel(scripts, max_workers=2, use_subprocess=True)
-    results = workflow.run()
-    assert len(results) == 3
-    assert all(r.returncode == 0 for r in results)
 
 
-def test_parallel_with_generator(simple_script):
+def _generator_scripts(path):
     gen = ConfigGenerator(iter([Config(globals_dict={"lr": i / 10}) for i in range(2)]))
-    scripts = [Script(str(simple_script), config=gen)]
-    workflow = Parallel(scripts, max_workers=2, use_subprocess=True)
+    return [Script(str(path), config=gen)]
+
+
+@pytest.mark.parametrize(
+    "build, expected",
+    [
+        (_static_scripts, 3),
+        pytest.param(_generator_scripts, 2, marks=pytest.mark.slow),
+    ],
+    ids=["static", "generator"],
+)
+def test_parallel_subprocess(shared_simple_script, build, expected):
+    workflow = Parallel(build(shared_simple_script), max_workers=2, use_subprocess=True)
     results = workflow.run()
-    assert len(results) == 2
+    assert len(results) == expected
+    assert all(r.returncode == 0 for r in results)
+
+
+def test_parallel_pool_uses_given_executor(make_script, restore_import_state):
+    p = make_script("ret.py", "value = 0\ndef main(): return value\n")
+    gen = ConfigGenerator(iter([Config(globals_dict={"value": i}) for i in (1, 2)]))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        workflow = Parallel(
+            [Script(str(p), config=gen)], use_subprocess=False, executor=pool
+        )
+        assert sorted(workflow.run()) == [1, 2]
+        # The caller's pool is left running.
+        assert pool.submit(lambda: "alive").result() == "alive"
 
 
 def test_parallel_no_scripts():
     with pytest.raises(ValueError):
         Parallel([])
+
+
+def test_parallel_dry_run_expands_generator(shared_simple_script):
+    gen = ConfigGenerator(iter([Config(globals_dict={"lr": i / 10}) for i in range(2)]))
+    workflow = Parallel([Script(str(shared_simple_script), config=gen)])
+    plan = workflow.dry_run()
+    assert [wid for wid, _ in plan] == [0, 1]
+    for _, cmd in plan:
+        assert str(shared_simple_script) in cmd
+        config_path = Path(cmd[cmd.index("--config") + 1])
+        assert config_path.exists()
+        config_path.unlink()
+
+
+def test_parallel_dry_run_rejects_pool_mode(shared_simple_script):
+    workflow = Parallel([Script(str(shared_simple_script))], use_subprocess=False)
+    with pytest.raises(ValueError, match="use_subprocess"):
+        workflow.dry_run()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="fork is only pinned on Linux")
+def test_pool_context_forks_when_single_threaded(monkeypatch):
+    monkeypatch.setattr(threading, "active_count", lambda: 1)
+    assert _pool_context().get_start_method() == "fork"
+
+
+def test_pool_context_default_with_threads(monkeypatch):
+    monkeypatch.setattr(threading, "active_count", lambda: 2)
+    assert _pool_context() is None
@@ -1,5 +1,7 @@
 """Tests for Sequential workflow."""
 
+from pathlib import Path
+
 import pytest
 
 from kohakuengine import Config, ConfigGenerator, Script, Sequential
@@ -31,11 +33,44 @@ def test_sequential_with_generator(make_script):
     assert results == [0, 1, 2]
 
 
+def test_sequential_iter_run_is_lazy(make_script):
+    s = make_script(
+        "a.py", "def main(): return iteration\nif __name__=='__main__':main()\n"
+    )
+    pulled = []
+
+    def configs():
+        for i in range(3):
+            pulled.append(i)
+            yield Config(globals_dict={"iteration": i})
+
+    script = Script(str(s), config=ConfigGenerator(configs()))
+    results = Sequential([script]).iter_run()
+    assert pulled == []
+    assert next(results) == 0
+    assert pulled == [0]
+    assert list(results) == [1, 2]
+
+
 def test_sequential_requires_scripts():
     with pytest.raises(ValueError, match="at least one"):
         Sequential([])
 
 
+def test_sequential_validate_checks_each_path_once(simple_script, monkeypatch):
+    scripts = [Script(str(simple_script)) for _ in range(3)]
+    checked = []
+    real_exists = Path.exists
+
+    def exists(self):
+        checked.append(self)
+        return real_exists(self)
+
+    monkeypatch.setattr(Path, "exists", exists)
+    Sequential(scripts)
+    assert len(checked) == 1
+
+
 def test_sequential_iterative_type_error(make_script):
     # Internal _run_iterative requires ConfigGenerator
     s = make_script("a.py", "def main(): return 1\nif __name__=='__main__':main()\n")
@@ -45,10 +80,10 @@ def test_sequential_iterative_type_error(make_script):
         seq._run_iterative(script)
 
 
-def test_sequential_subprocess_mode(simple_script):
+def test_sequential_subprocess_mode(shared_simple_script):
     cfg = Config(globals_dict={"lr": 0.42})
-    s = Script(str(simple_script), config=cfg)
+    s = Script(str(shared_simple_script), config=cfg)
     workflow = Sequential([s], use_subprocess=True)
     results = workflow.run()
-    # Subprocess mode returns CompletedProcess-like objects
+    # Subprocess mode returns finished Popen objects
     assert all(r.returncode == 0 for r in results)